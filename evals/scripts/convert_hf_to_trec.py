@@ -8,75 +8,114 @@ Usage:
 
 import argparse
 import json
+from collections import defaultdict
 from pathlib import Path
+import numpy as np
 from datasets import load_dataset
+from tqdm import tqdm
 
 
-def convert_to_trec_runs(dataset, output_path: Path, run_tag: str = "hf_run"):
+def convert_to_trec(dataset, output_path: Path, run_tag: str = "hf_run"):
     """
-    Convert HuggingFace dataset to TREC runs format.
+    Convert HuggingFace dataset to TREC runs and qrels formats in one pass.
     
-    NOTE: This creates runs from positive passages, which is useful for qrels
+    Qrels rows are written as each example is read; runs are grouped per
+    query and written at the end since they need sorting by score. This
+    lets `dataset` be a streaming `IterableDataset` that is only walked once.
+    
+    NOTE: The runs are created from positive passages, which is useful for qrels
     but NOT for actual retrieval evaluation. For real evaluation, you need to:
     1. Run a retrieval system (BM25, dense retrieval, etc.) on the corpus
     2. Generate actual retrieval runs with scores
     3. Then use those runs for fusion evaluation
-    
-    This function is primarily for creating qrels from positive passages.
     """
     runs_file = output_path / "runs.txt"
-    
-    # Group by query_id first
-    by_query = {}
-    for example in dataset:
-        query_id = str(example.get("query_id", example.get("_id", "")))
-        if query_id not in by_query:
-            by_query[query_id] = []
-        
-        # Handle different dataset structures
-        if "positive_passages" in example:
-            # MIRACL/LoTTE style - these are actually qrels, not runs
-            # We'll create synthetic runs for demonstration
-            for rank, passage in enumerate(example["positive_passages"][:100]):
-                doc_id = passage.get("docid", passage.get("doc_id", ""))
-                score = 1.0 - (rank * 0.01)  # Simple scoring
-                by_query[query_id].append((doc_id, score, rank))
-        elif "corpus_id" in example:
-            # BEIR style - actual retrieval result
-            doc_id = example["corpus_id"]
-            score = example.get("score", 1.0)
-            rank = example.get("rank", 1)
-            by_query[query_id].append((doc_id, score, rank))
-    
-    # Write grouped and sorted by query
-    with open(runs_file, "w") as f:
-        for query_id in sorted(by_query.keys()):
-            # Sort by score descending within each query
-            entries = by_query[query_id]
-            entries.sort(key=lambda x: x[1], reverse=True)
-            
-            for rank, (doc_id, score, _) in enumerate(entries, start=1):
-                f.write(f"{query_id} Q0 {doc_id} {rank} {score:.6f} {run_tag}\n")
-
-
-def convert_to_trec_qrels(dataset, output_path: Path):
-    """Convert HuggingFace dataset to TREC qrels format."""
     qrels_file = output_path / "qrels.txt"
     
-    with open(qrels_file, "w") as f:
-        for example in dataset:
-            query_id = str(example.get("query_id", example.get("_id", "")))
+    # Group runs by query_id while streaming qrels straight to disk
+    by_query = defaultdict(lambda: {"doc_ids": [], "scores": []})
+    # A dataset uses one key layout throughout, so resolve it from the first row seen
+    qid_key = doc_key = None
+    # Write UTF-8 bytes directly and skip the text layer. Ids can be non-ASCII
+    # (BEIR FEVER/HotpotQA use Wikipedia titles as doc ids)
+    with qrels_file.open("wb", buffering=1 << 20) as qrels:
+        for example in tqdm(dataset, desc="Converting", unit=" examples"):
+            if qid_key is None:
+                qid_key = "query_id" if "query_id" in example else "_id"
+            query_id = str(example.get(qid_key, ""))
+            entries = by_query[query_id]
+            qrels_lines = []
             
-            # Handle positive passages
+            # Handle different dataset structures
             if "positive_passages" in example:
-                for passage in example["positive_passages"]:
-                    doc_id = passage.get("docid", passage.get("doc_id", ""))
+                # MIRACL/LoTTE style - these are actually qrels, not runs
+                # We'll create synthetic runs for demonstration
+                passages = example["positive_passages"]
+                if doc_key is None and passages:
+                    doc_key = "docid" if "docid" in passages[0] else "doc_id"
+                doc_ids = [p.get(doc_key, "") for p in passages]
+                for doc_id, passage in zip(doc_ids, passages):
                     relevance = passage.get("score", 1)  # Default to relevant
-                    f.write(f"{query_id} 0 {doc_id} {relevance}\n")
-            elif "positive" in example:
+                    qrels_lines.append(f"{query_id} 0 {doc_id} {relevance}\n")
+                
+                top = doc_ids[:100]
+                entries["doc_ids"].extend(top)
+                entries["scores"].extend((1.0 - np.arange(len(top)) * 0.01).tolist())  # Simple scoring
+            elif "corpus_id" in example:
+                # BEIR style - actual retrieval result
+                entries["doc_ids"].append(example["corpus_id"])
+                entries["scores"].append(example.get("score", 1.0))
+            
+            if "positive" in example and "positive_passages" not in example:
                 doc_id = example["positive"].get("docid", example["positive"].get("_id", ""))
                 relevance = example.get("score", 1)
-                f.write(f"{query_id} 0 {doc_id} {relevance}\n")
+                qrels_lines.append(f"{query_id} 0 {doc_id} {relevance}\n")
+            
+            if qrels_lines:
+                qrels.write("".join(qrels_lines).encode("utf-8"))
+    
+    # Write grouped and sorted by query, one write per query
+    with runs_file.open("wb", buffering=1 << 20) as f:
+        for query_id, entries in sorted(by_query.items()):
+            # Sort by score descending within each query (ties keep input order)
+            doc_ids = entries["doc_ids"]
+            if not doc_ids:
+                continue
+            scores = np.asarray(entries["scores"], dtype=np.float64)
+            order = np.argsort(-scores, kind="stable")
+            
+            doc_ids_sorted = [doc_ids[i] for i in order]
+            scores_sorted = scores[order].tolist()
+            
+            block = "\n".join(
+                f"{query_id} Q0 {doc_id} {rank} {score:.6f} {run_tag}"
+                for rank, (doc_id, score) in enumerate(zip(doc_ids_sorted, scores_sorted), start=1)
+            )
+            f.write((block + "\n").encode("utf-8"))
+
+
+def load_split(dataset_id: str, split: str, language: str = None):
+    """
+    Stream a single split of a HuggingFace dataset.
+    
+    For multilingual datasets the language config is tried first; if the repo
+    does not expose it as a config, fall back to loading only that language's
+    split files via `data_files` so the other subsets are never resolved.
+    """
+    kwargs = {"streaming": True}
+    if not language:
+        return load_dataset(dataset_id, split=split, **kwargs)
+    
+    try:
+        return load_dataset(dataset_id, language, split=split, **kwargs)
+    except (ValueError, FileNotFoundError) as config_error:
+        for ext in ("jsonl", "parquet"):
+            data_files = f"{language}/{split}-*.{ext}"
+            try:
+                return load_dataset(dataset_id, data_files=data_files, split="train", **kwargs)
+            except FileNotFoundError:
+                continue
+        raise config_error
 
 
 def main():
@@ -94,20 +133,12 @@ def main():
     
     print(f"Loading dataset: {args.dataset}")
     
-    # Load dataset
-    if args.language:
-        dataset = load_dataset(args.dataset, args.language, split=args.split)
-    else:
-        dataset = load_dataset(args.dataset, split=args.split)
-    
-    print(f"Dataset loaded: {len(dataset)} examples")
+    # Stream the split instead of materializing it; it is only walked once
+    dataset = load_split(args.dataset, args.split, args.language)
     
     # Convert to TREC format
-    print("Converting to TREC runs format...")
-    convert_to_trec_runs(dataset, output_dir, args.run_tag)
-    
-    print("Converting to TREC qrels format...")
-    convert_to_trec_qrels(dataset, output_dir)
+    print("Converting to TREC runs and qrels formats...")
+    convert_to_trec(dataset, output_dir, args.run_tag)
     
     print(f"\nConversion complete!")
     print(f"  Runs: {output_dir / 'runs.txt'}")
@@ -4,6 +4,7 @@
 #     "matplotlib>=3.7.0",
 #     "numpy>=1.24.0",
 #     "scipy>=1.10.0",
+#     "orjson>=3.9.0",
 # ]
 # ///
 """
@@ -11,16 +12,24 @@ Add hypothesis testing to existing RRF visualizations.
 Enhances statistical rigor with t-tests, ANOVA, effect sizes.
 """
 
+import matplotlib
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import numpy as np
 import scipy.stats as stats
 from pathlib import Path
-import json
+from collections import defaultdict
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
 
 # Set style
 plt.style.use('seaborn-v0_8-darkgrid')
 plt.rcParams['figure.figsize'] = (12, 8)
 plt.rcParams['font.size'] = 11
+plt.rcParams['agg.path.chunksize'] = 10000
 
 output_dir = Path(__file__).parent
 output_dir.mkdir(exist_ok=True)
@@ -31,16 +40,14 @@ if not eval_json.exists():
     eval_json = output_dir.parent.parent.parent / "rank-fusion" / "evals" / "eval_results.json"
 
 if eval_json.exists():
-    with open(eval_json) as f:
-        eval_results = json.load(f)
+    with open(eval_json, 'rb') as f:
+        eval_results = _json.loads(f.read())
     
     # Extract method metrics
-    methods_data = {}
+    methods_data = defaultdict(lambda: {'ndcg_at_10': [], 'precision_at_10': [], 'mrr': []})
     for scenario in eval_results:
         methods = scenario.get('methods', {})
         for method_name, method_data in methods.items():
-            if method_name not in methods_data:
-                methods_data[method_name] = {'ndcg_at_10': [], 'precision_at_10': [], 'mrr': []}
             metrics = method_data.get('metrics', {})
             if 'ndcg_at_10' in metrics:
                 methods_data[method_name]['ndcg_at_10'].append(metrics['ndcg_at_10'])
@@ -49,13 +56,19 @@ if eval_json.exists():
             if 'mrr' in metrics:
                 methods_data[method_name]['mrr'].append(metrics['mrr'])
     
+    # Materialize each metric vector as an array once; reused by every test below
+    for method_name in methods_data:
+        for metric in methods_data[method_name]:
+            methods_data[method_name][metric] = np.asarray(methods_data[method_name][metric], dtype=np.float64)
+    
     # Focus on key methods
     key_methods = ['rrf', 'combsum', 'combmnz', 'borda']
     available_methods = {k: v for k, v in methods_data.items() if k in key_methods}
     
     if available_methods:
-        # Hypothesis Testing Visualization
-        fig, axes = plt.subplots(1, 3, figsize=(18, 5))
+        # Hypothesis Testing Visualization (figure is reused for the effect size chart)
+        fig = plt.figure(figsize=(18, 5))
+        axes = fig.subplots(1, 3)
         
         metrics_to_test = ['ndcg_at_10', 'precision_at_10', 'mrr']
         metric_names = ['NDCG@10', 'Precision@10', 'MRR']
@@ -68,8 +81,8 @@ if eval_json.exists():
             method_labels = []
             for method in key_methods:
                 if method in available_methods:
-                    data = available_methods[method].get(metric, [])
-                    if data:
+                    data = available_methods[method][metric]
+                    if data.size:
                         method_data_list.append(data)
                         method_labels.append(method.upper())
             
@@ -101,15 +114,19 @@ if eval_json.exists():
                 
                 # Pairwise t-tests (RRF vs others)
                 if 'rrf' in available_methods and len(method_data_list) >= 2:
-                    rrf_data = available_methods['rrf'].get(metric, [])
-                    if rrf_data:
+                    rrf_data = available_methods['rrf'][metric]
+                    if rrf_data.size:
+                        rrf_len = len(rrf_data)
+                        valid = [method for method in key_methods
+                                 if method != 'rrf' and method in available_methods
+                                 and len(available_methods[method][metric]) == rrf_len]
                         pairwise_results = []
-                        for method in key_methods:
-                            if method != 'rrf' and method in available_methods:
-                                other_data = available_methods[method].get(metric, [])
-                                if other_data and len(rrf_data) == len(other_data):
-                                    t_stat, p_val = stats.ttest_rel(rrf_data, other_data)
-                                    pairwise_results.append(f'{method.upper()}: p={p_val:.3f}')
+                        if valid:
+                            # One batched paired t-test, one row per method
+                            others = np.vstack([available_methods[m][metric] for m in valid])
+                            t_stats, p_vals = stats.ttest_rel(np.broadcast_to(rrf_data, others.shape),
+                                                              others, axis=1)
+                            pairwise_results = [f'{m.upper()}: p={p:.3f}' for m, p in zip(valid, p_vals)]
                         
                         if pairwise_results:
                             pairwise_text = 'Pairwise vs RRF:\n' + '\n'.join(pairwise_results[:3])
@@ -123,33 +140,36 @@ if eval_json.exists():
                         fontweight='bold')
             ax.grid(True, alpha=0.3, axis='y')
         
-        plt.tight_layout()
-        plt.savefig(output_dir / 'rrf_hypothesis_testing.png', dpi=150, bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        fig.savefig(output_dir / 'rrf_hypothesis_testing.png', dpi=150)
         print("✅ Generated: rrf_hypothesis_testing.png")
         
         # Effect Size Analysis
-        fig, ax = plt.subplots(figsize=(12, 7))
+        fig.clf()
+        fig.set_size_inches(12, 7)
+        ax = fig.subplots()
         
         # Compute Cohen's d for RRF vs each method
         if 'rrf' in available_methods:
-            rrf_ndcg = available_methods['rrf'].get('ndcg_at_10', [])
-            if rrf_ndcg:
-                effect_sizes = []
-                method_names = []
+            rrf_ndcg = available_methods['rrf']['ndcg_at_10']
+            if rrf_ndcg.size:
+                # Only methods with one NDCG@10 value per RRF scenario can be compared
+                rrf_len = len(rrf_ndcg)
+                valid = [method for method in key_methods
+                         if method != 'rrf' and method in available_methods
+                         and len(available_methods[method]['ndcg_at_10']) == rrf_len]
+                method_names = [method.upper() for method in valid]
+                effect_sizes = np.empty(0)
                 
-                for method in key_methods:
-                    if method != 'rrf' and method in available_methods:
-                        other_ndcg = available_methods[method].get('ndcg_at_10', [])
-                        if other_ndcg and len(rrf_ndcg) == len(other_ndcg):
-                            # Cohen's d
-                            pooled_std = np.sqrt((np.var(rrf_ndcg) + np.var(other_ndcg)) / 2)
-                            if pooled_std > 0:
-                                d = (np.mean(rrf_ndcg) - np.mean(other_ndcg)) / pooled_std
-                                effect_sizes.append(d)
-                                method_names.append(method.upper())
+                if valid:
+                    # Cohen's d for all methods at once (one row per method)
+                    others = np.vstack([available_methods[m]['ndcg_at_10'] for m in valid])
+                    pooled_std = np.sqrt((rrf_ndcg.var() + others.var(axis=1)) / 2)
+                    mean_diff = rrf_ndcg.mean() - others.mean(axis=1)
+                    effect_sizes = np.divide(mean_diff, pooled_std,
+                                             out=np.zeros_like(mean_diff), where=pooled_std > 0)
                 
-                if effect_sizes:
+                if effect_sizes.size:
                     colors_effect = ['#00ff88' if d > 0 else '#ff4757' for d in effect_sizes]
                     bars = ax.barh(method_names, effect_sizes, color=colors_effect, alpha=0.8,
                                   edgecolor='black', linewidth=1.5)
@@ -172,10 +192,10 @@ if eval_json.exists():
                     ax.legend(frameon=True, fancybox=True, shadow=True)
                     ax.grid(True, alpha=0.3, axis='x')
                     
-                    plt.tight_layout()
-                    plt.savefig(output_dir / 'rrf_effect_size.png', dpi=150, bbox_inches='tight')
-                    plt.close()
+                    fig.tight_layout()
+                    fig.savefig(output_dir / 'rrf_effect_size.png', dpi=150)
                     print("✅ Generated: rrf_effect_size.png")
         
+        plt.close(fig)
         print("\n✅ Hypothesis testing visualizations generated!")
 
@@ -9,14 +9,29 @@ Validate that visualization images were generated correctly.
 
 Checks:
     - Files exist
-    - Images are valid PNG files
+    - Images are valid PNG files (signature and IHDR header)
     - Images meet minimum size requirements
-    - Images are not corrupted
 """
 
+import struct
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from PIL import Image
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+def read_png_size(png_path):
+    """Read (width, height) from the PNG signature and IHDR chunk (first 24 bytes)."""
+    with open(png_path, "rb") as f:
+        head = f.read(24)
+    
+    if len(head) < 24 or head[:8] != PNG_SIGNATURE or head[12:16] != b"IHDR":
+        # Not a PNG we can read cheaply; let Pillow explain what it is
+        from PIL import Image
+        with Image.open(png_path) as img:
+            raise ValueError(f"not a PNG file (detected {img.format})")
+    
+    return struct.unpack(">II", head[16:24])
 
 def validate_image(png_path):
     """Validate a single image file."""
@@ -24,12 +39,7 @@ def validate_image(png_path):
         return False, f"File not found: {png_path}"
     
     try:
-        img = Image.open(png_path)
-        img.verify()  # Verify it's not corrupted
-        
-        # Reopen for size check (verify() closes the file)
-        img = Image.open(png_path)
-        width, height = img.size
+        width, height = read_png_size(png_path)
         
         if width < 800 or height < 600:
             return False, f"Image too small: {width}x{height} (minimum 800x600)"
@@ -57,10 +67,11 @@ def main():
     
     all_valid = True
     
-    for filename in expected_files:
-        filepath = script_dir / filename
-        is_valid, message = validate_image(filepath)
-        
+    # Checks are I/O-bound, so overlap them; map() keeps the output order stable
+    with ThreadPoolExecutor(max_workers=len(expected_files)) as executor:
+        results = list(executor.map(lambda name: validate_image(script_dir / name), expected_files))
+    
+    for filename, (is_valid, message) in zip(expected_files, results):
         if is_valid:
             print(f"✅ {filename}: {message}")
         else:
@@ -5,26 +5,27 @@ import rank_fusion
 from typing import List, Tuple
 
 
-# Test data fixtures
-@pytest.fixture
+# Test data fixtures (session-scoped: built once, never mutated by tests).
+# They stay lists because the bindings accept only Python lists, not tuples.
+@pytest.fixture(scope="session")
 def bm25_results() -> List[Tuple[str, float]]:
     """BM25 retrieval results."""
     return [("doc_A", 12.5), ("doc_B", 11.0), ("doc_C", 9.0)]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def dense_results() -> List[Tuple[str, float]]:
     """Dense vector retrieval results."""
     return [("doc_B", 0.9), ("doc_D", 0.8), ("doc_A", 0.7)]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def keyword_results() -> List[Tuple[str, float]]:
     """Keyword-based retrieval results."""
     return [("doc_C", 0.95), ("doc_E", 0.85), ("doc_A", 0.75)]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def multi_lists(
     bm25_results: List[Tuple[str, float]],
     dense_results: List[Tuple[str, float]],
@@ -34,28 +35,75 @@ def multi_lists(
     return [bm25_results, dense_results, keyword_results]
 
 
-# RRF Tests
-class TestRRF:
-    """Tests for Reciprocal Rank Fusion (RRF)."""
+@pytest.fixture(scope="module")
+def retriever_ids() -> List["rank_fusion.RetrieverIdPy"]:
+    """Retriever identifiers matching the order of multi_lists."""
+    return [rank_fusion.RetrieverIdPy(name) for name in ("BM25", "Dense", "Keyword")]
 
-    def test_rrf_basic(
-        self, bm25_results: List[Tuple[str, float]], dense_results: List[Tuple[str, float]]
+
+# Pairwise fusion functions and their multi-list counterparts
+FUSIONS = [
+    ("rrf", "rrf_multi"),
+    ("isr", "isr_multi"),
+    ("combsum", "combsum_multi"),
+    ("combmnz", "combmnz_multi"),
+    ("borda", "borda_multi"),
+    ("dbsf", "dbsf_multi"),
+]
+
+
+# Shared Fusion Tests
+@pytest.mark.parametrize("fn_name,multi_name", FUSIONS)
+class TestPairwiseFusion:
+    """Structural tests shared by RRF, ISR, CombSUM, CombMNZ, Borda and DBSF."""
+
+    def test_basic(
+        self,
+        fn_name: str,
+        multi_name: str,
+        bm25_results: List[Tuple[str, float]],
+        dense_results: List[Tuple[str, float]],
     ):
-        """Test basic RRF fusion."""
-        result = rank_fusion.rrf(bm25_results, dense_results, k=60)
+        """Test basic two-list fusion with default parameters."""
+        result = getattr(rank_fusion, fn_name)(bm25_results, dense_results)
         assert isinstance(result, list)
         assert len(result) > 0
         assert all(isinstance(item, tuple) and len(item) == 2 for item in result)
         assert all(isinstance(score, (int, float)) for _, score in result)
 
-    def test_rrf_default_k(
-        self, bm25_results: List[Tuple[str, float]], dense_results: List[Tuple[str, float]]
+    def test_top_k(
+        self,
+        fn_name: str,
+        multi_name: str,
+        bm25_results: List[Tuple[str, float]],
+        dense_results: List[Tuple[str, float]],
+    ):
+        """Test two-list fusion with top_k."""
+        result = getattr(rank_fusion, fn_name)(bm25_results, dense_results, top_k=2)
+        assert isinstance(result, list)
+        assert len(result) <= 2
+
+    def test_multi(
+        self, fn_name: str, multi_name: str, multi_lists: List[List[Tuple[str, float]]]
     ):
-        """Test RRF with default k value."""
-        result = rank_fusion.rrf(bm25_results, dense_results)
+        """Test fusion of multiple lists."""
+        result = getattr(rank_fusion, multi_name)(multi_lists)
         assert isinstance(result, list)
         assert len(result) > 0
 
+    def test_multi_top_k(
+        self, fn_name: str, multi_name: str, multi_lists: List[List[Tuple[str, float]]]
+    ):
+        """Test fusion of multiple lists with top_k."""
+        result = getattr(rank_fusion, multi_name)(multi_lists, top_k=3)
+        assert isinstance(result, list)
+        assert len(result) <= 3
+
+
+# RRF Tests
+class TestRRF:
+    """RRF-specific tests for the k parameter and empty inputs."""
+
     def test_rrf_custom_k(
         self, bm25_results: List[Tuple[str, float]], dense_results: List[Tuple[str, float]]
     ):
@@ -63,13 +111,13 @@ class TestRRF:
         result = rank_fusion.rrf(bm25_results, dense_results, k=20)
         assert isinstance(result, list)
 
-    def test_rrf_top_k(
-        self, bm25_results: List[Tuple[str, float]], dense_results: List[Tuple[str, float]]
+    def test_rrf_multi_custom_k(
+        self, multi_lists: List[List[Tuple[str, float]]]
     ):
-        """Test RRF with top_k parameter."""
-        result = rank_fusion.rrf(bm25_results, dense_results, k=60, top_k=2)
+        """Test RRF multi with explicit k and top_k."""
+        result = rank_fusion.rrf_multi(multi_lists, k=60, top_k=3)
         assert isinstance(result, list)
-        assert len(result) <= 2
+        assert 0 < len(result) <= 3
 
     def test_rrf_k_zero_error(
         self, bm25_results: List[Tuple[str, float]], dense_results: List[Tuple[str, float]]
@@ -84,22 +132,6 @@ class TestRRF:
         assert isinstance(result, list)
         assert len(result) == 0
 
-    def test_rrf_multi(
-        self, multi_lists: List[List[Tuple[str, float]]]
-    ):
-        """Test RRF for multiple lists."""
-        result = rank_fusion.rrf_multi(multi_lists, k=60)
-        assert isinstance(result, list)
-        assert len(result) > 0
-
-    def test_rrf_multi_top_k(
-        self, multi_lists: List[List[Tuple[str, float]]]
-    ):
-        """Test RRF multi with top_k."""
-        result = rank_fusion.rrf_multi(multi_lists, k=60, top_k=3)
-        assert isinstance(result, list)
-        assert len(result) <= 3
-
     def test_rrf_multi_empty(self):
         """Test RRF multi with empty list."""
         result = rank_fusion.rrf_multi([])
@@ -109,121 +141,24 @@ class TestRRF:
 
 # ISR Tests
 class TestISR:
-    """Tests for Inverse Square Rank (ISR)."""
+    """ISR-specific tests for the k parameter."""
 
-    def test_isr_basic(
+    def test_isr_custom_k(
         self, bm25_results: List[Tuple[str, float]], dense_results: List[Tuple[str, float]]
     ):
-        """Test basic ISR fusion."""
-        result = rank_fusion.isr(bm25_results, dense_results, k=1)
-        assert isinstance(result, list)
-        assert len(result) > 0
-
-    def test_isr_default_k(
-        self, bm25_results: List[Tuple[str, float]], dense_results: List[Tuple[str, float]]
-    ):
-        """Test ISR with default k."""
-        result = rank_fusion.isr(bm25_results, dense_results)
-        assert isinstance(result, list)
-
-    def test_isr_top_k(
-        self, bm25_results: List[Tuple[str, float]], dense_results: List[Tuple[str, float]]
-    ):
-        """Test ISR with top_k."""
+        """Test ISR with explicit k and top_k."""
         result = rank_fusion.isr(bm25_results, dense_results, k=1, top_k=2)
-        assert len(result) <= 2
+        assert isinstance(result, list)
+        assert 0 < len(result) <= 2
 
-    def test_isr_multi(
+    def test_isr_multi_custom_k(
         self, multi_lists: List[List[Tuple[str, float]]]
     ):
-        """Test ISR for multiple lists."""
+        """Test ISR multi with explicit k."""
         result = rank_fusion.isr_multi(multi_lists, k=1)
         assert isinstance(result, list)
-
-
-# CombSUM Tests
-class TestCombSUM:
-    """Tests for CombSUM fusion."""
-
-    def test_combsum_basic(
-        self, bm25_results: List[Tuple[str, float]], dense_results: List[Tuple[str, float]]
-    ):
-        """Test basic CombSUM fusion."""
-        result = rank_fusion.combsum(bm25_results, dense_results)
-        assert isinstance(result, list)
         assert len(result) > 0
 
-    def test_combsum_top_k(
-        self, bm25_results: List[Tuple[str, float]], dense_results: List[Tuple[str, float]]
-    ):
-        """Test CombSUM with top_k."""
-        result = rank_fusion.combsum(bm25_results, dense_results, top_k=2)
-        assert len(result) <= 2
-
-    def test_combsum_multi(
-        self, multi_lists: List[List[Tuple[str, float]]]
-    ):
-        """Test CombSUM for multiple lists."""
-        result = rank_fusion.combsum_multi(multi_lists)
-        assert isinstance(result, list)
-
-
-# CombMNZ Tests
-class TestCombMNZ:
-    """Tests for CombMNZ fusion."""
-
-    def test_combmnz_basic(
-        self, bm25_results: List[Tuple[str, float]], dense_results: List[Tuple[str, float]]
-    ):
-        """Test basic CombMNZ fusion."""
-        result = rank_fusion.combmnz(bm25_results, dense_results)
-        assert isinstance(result, list)
-
-    def test_combmnz_multi(
-        self, multi_lists: List[List[Tuple[str, float]]]
-    ):
-        """Test CombMNZ for multiple lists."""
-        result = rank_fusion.combmnz_multi(multi_lists)
-        assert isinstance(result, list)
-
-
-# Borda Tests
-class TestBorda:
-    """Tests for Borda count fusion."""
-
-    def test_borda_basic(
-        self, bm25_results: List[Tuple[str, float]], dense_results: List[Tuple[str, float]]
-    ):
-        """Test basic Borda fusion."""
-        result = rank_fusion.borda(bm25_results, dense_results)
-        assert isinstance(result, list)
-
-    def test_borda_multi(
-        self, multi_lists: List[List[Tuple[str, float]]]
-    ):
-        """Test Borda for multiple lists."""
-        result = rank_fusion.borda_multi(multi_lists)
-        assert isinstance(result, list)
-
-
-# DBSF Tests
-class TestDBSF:
-    """Tests for DBSF fusion."""
-
-    def test_dbsf_basic(
-        self, bm25_results: List[Tuple[str, float]], dense_results: List[Tuple[str, float]]
-    ):
-        """Test basic DBSF fusion."""
-        result = rank_fusion.dbsf(bm25_results, dense_results)
-        assert isinstance(result, list)
-
-    def test_dbsf_multi(
-        self, multi_lists: List[List[Tuple[str, float]]]
-    ):
-        """Test DBSF for multiple lists."""
-        result = rank_fusion.dbsf_multi(multi_lists)
-        assert isinstance(result, list)
-
 
 # Weighted Tests
 class TestWeighted:
@@ -305,15 +240,18 @@ class TestAdditiveMultiTask:
         )
         assert isinstance(result, list)
 
+    @pytest.mark.parametrize("norm", ["zscore", "minmax", "sum", "rank", "none"])
     def test_additive_multi_task_normalizations(
-        self, bm25_results: List[Tuple[str, float]], dense_results: List[Tuple[str, float]]
+        self,
+        bm25_results: List[Tuple[str, float]],
+        dense_results: List[Tuple[str, float]],
+        norm: str,
     ):
         """Test additive multi-task with different normalizations."""
-        for norm in ["zscore", "minmax", "sum", "rank", "none"]:
-            result = rank_fusion.additive_multi_task(
-                bm25_results, dense_results, weights=(1.0, 1.0), normalization=norm
-            )
-            assert isinstance(result, list)
+        result = rank_fusion.additive_multi_task(
+            bm25_results, dense_results, weights=(1.0, 1.0), normalization=norm
+        )
+        assert isinstance(result, list)
 
     def test_additive_multi_task_invalid_normalization(
         self, bm25_results: List[Tuple[str, float]], dense_results: List[Tuple[str, float]]
@@ -368,14 +306,11 @@ class TestExplainability:
     """Tests for explainability functions."""
 
     def test_rrf_explain(
-        self, multi_lists: List[List[Tuple[str, float]]]
+        self,
+        multi_lists: List[List[Tuple[str, float]]],
+        retriever_ids: List["rank_fusion.RetrieverIdPy"],
     ):
         """Test RRF explainability."""
-        retriever_ids = [
-            rank_fusion.RetrieverIdPy("BM25"),
-            rank_fusion.RetrieverIdPy("Dense"),
-            rank_fusion.RetrieverIdPy("Keyword"),
-        ]
         result = rank_fusion.rrf_explain(multi_lists, retriever_ids, k=60)
         assert isinstance(result, list)
         if len(result) > 0:
@@ -386,38 +321,29 @@ class TestExplainability:
             assert hasattr(item, "explanation")
 
     def test_combsum_explain(
-        self, multi_lists: List[List[Tuple[str, float]]]
+        self,
+        multi_lists: List[List[Tuple[str, float]]],
+        retriever_ids: List["rank_fusion.RetrieverIdPy"],
     ):
         """Test CombSUM explainability."""
-        retriever_ids = [
-            rank_fusion.RetrieverIdPy("BM25"),
-            rank_fusion.RetrieverIdPy("Dense"),
-            rank_fusion.RetrieverIdPy("Keyword"),
-        ]
         result = rank_fusion.combsum_explain(multi_lists, retriever_ids)
         assert isinstance(result, list)
 
     def test_combmnz_explain(
-        self, multi_lists: List[List[Tuple[str, float]]]
+        self,
+        multi_lists: List[List[Tuple[str, float]]],
+        retriever_ids: List["rank_fusion.RetrieverIdPy"],
     ):
         """Test CombMNZ explainability."""
-        retriever_ids = [
-            rank_fusion.RetrieverIdPy("BM25"),
-            rank_fusion.RetrieverIdPy("Dense"),
-            rank_fusion.RetrieverIdPy("Keyword"),
-        ]
         result = rank_fusion.combmnz_explain(multi_lists, retriever_ids)
         assert isinstance(result, list)
 
     def test_dbsf_explain(
-        self, multi_lists: List[List[Tuple[str, float]]]
+        self,
+        multi_lists: List[List[Tuple[str, float]]],
+        retriever_ids: List["rank_fusion.RetrieverIdPy"],
     ):
         """Test DBSF explainability."""
-        retriever_ids = [
-            rank_fusion.RetrieverIdPy("BM25"),
-            rank_fusion.RetrieverIdPy("Dense"),
-            rank_fusion.RetrieverIdPy("Keyword"),
-        ]
         result = rank_fusion.dbsf_explain(multi_lists, retriever_ids)
         assert isinstance(result, list)
 